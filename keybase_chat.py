@@ -1,22 +1,21 @@
 #!/usr/bin/env python3
 import asyncio
+import heapq
 import json
 import os
-import re
 import sys
-import datetime
+import time
 
+import orjson
+
+from rich.text import Text
 from textual.app import App
 from textual.screen import Screen
 from textual.containers import Vertical
-from textual.widgets import Header, Footer, Input, ListView, ListItem, Static
+from textual.widgets import Header, Footer, Input, ListView, ListItem
 
 import logging
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-)
+logger = logging.getLogger(__name__)
 
 #########################################
 # Helper Functions and Configuration
@@ -27,21 +26,43 @@ DEFAULT_CONFIG = {
     "max_recent": 0,            # 0 means no limit.
     "hide_names": [],           # List of substrings to hide.
     "read_at_least": 10,        # Number of messages to load initially.
-    "download_path": "./downloads"
+    "download_path": "./downloads",
+    "conversation_cache_ttl": 60    # Seconds the cached conversation list is trusted.
 }
 
+CONVERSATION_CACHE_DIR = os.path.expanduser("~/.cache/keybase_chat")
+
+# Longest JSON line accepted from the keybase chat api pipes. asyncio's 64 KiB
+# default is too small for large conversation lists and message reads.
+API_LINE_LIMIT = 2 ** 24
+
+# Seconds to wait before restarting an api-listen process that exited.
+LISTEN_RESTART_DELAY = 5
+
+# Most pages of history to read while looking for read_at_least messages.
+HISTORY_MAX_PAGES = 10
+
+# Seconds to collect pushed messages before mounting them as one batch.
+MESSAGE_FLUSH_DELAY = 0.05
+
 
 def load_config():
+    """Return DEFAULT_CONFIG overlaid with config.json, so every key is always present."""
+    config = dict(DEFAULT_CONFIG)
     config_file = "config.json"
     if os.path.exists(config_file):
         try:
             with open(config_file, "r") as f:
-                return json.load(f)
+                config.update(json.load(f))
         except Exception as e:
             print("Error loading config file:", e)
-            return DEFAULT_CONFIG
-    else:
-        return DEFAULT_CONFIG
+    if config["debug"]:
+        logging.basicConfig(
+            filename="debug.log",
+            level=logging.DEBUG,
+            format="%(asctime)s [%(levelname)s] %(message)s",
+        )
+    return config
 
 async def get_current_user():
     proc = await asyncio.create_subprocess_exec(
@@ -55,23 +76,64 @@ async def get_current_user():
         return None
     return stdout.decode().strip()
 
-async def list_conversations():
-    payload = {"method": "list", "params": {"options": {}}}
-    proc = await asyncio.create_subprocess_exec(
-        "keybase", "chat", "api", "-m", json.dumps(payload),
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
-    )
-    stdout, stderr = await proc.communicate()
-    if proc.returncode != 0:
-        print("Error listing conversations:", stderr.decode().strip())
+def api_error(data):
+    """Return the error message of a JSON-RPC reply, or None if it succeeded."""
+    error = data.get("error")
+    if error is None:
+        return None
+    if isinstance(error, dict):
+        return error.get("message", str(error))
+    return str(error)
+
+async def list_conversations(app):
+    data = await app.api_call({"method": "list", "params": {"options": {}}})
+    error = api_error(data)
+    if error:
+        print("Error listing conversations:", error)
         return []
+    return data.get("result", {}).get("conversations", [])
+
+def conversation_cache_path(current_user):
+    # One file per Keybase account, so switching accounts never shows the
+    # other account's conversations.
+    return os.path.join(CONVERSATION_CACHE_DIR, f"convs-{current_user}.json")
+
+def read_conversation_cache(current_user, ttl):
+    """Return the cached conversation list if it is younger than ttl seconds, else None."""
+    path = conversation_cache_path(current_user)
     try:
-        data = json.loads(stdout.decode())
-        return data.get("result", {}).get("conversations", [])
-    except Exception as e:
-        print("Error parsing conversation list:", e)
-        return []
+        if time.time() - os.stat(path).st_mtime >= ttl:
+            return None
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def write_conversation_cache(current_user, conversations):
+    # The list reveals who the user talks to, so keep it private to them.
+    path = conversation_cache_path(current_user)
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(CONVERSATION_CACHE_DIR, mode=0o700, exist_ok=True)
+        os.chmod(CONVERSATION_CACHE_DIR, 0o700)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), 0o600)
+            f.write(orjson.dumps(conversations))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Error writing conversation cache: %s", e)
+
+async def list_conversations_cached(app, config, current_user):
+    """Return (conversations, from_cache), only calling the API when the cache is stale."""
+    ttl = config["conversation_cache_ttl"]
+    cached = await asyncio.to_thread(read_conversation_cache, current_user, ttl)
+    if cached is not None:
+        return cached, True
+    conversations = await list_conversations(app)
+    if conversations:
+        await asyncio.to_thread(write_conversation_cache, current_user, conversations)
+    return conversations, False
 
 def conversation_display_name(conv, current_user):
     ch = conv.get("channel", {})
@@ -85,27 +147,50 @@ def conversation_display_name(conv, current_user):
             filtered = names_list
         return ",".join(filtered)
 
-def get_conversation_spec(conv):
-    ch = conv.get("channel", {})
-    if ch.get("members_type") == "team":
-        return f"{ch.get('name','')},{ch.get('topic_name','')}"
-    else:
-        return ch.get("name", "")
-
-async def read_previous_messages(conv, config):
-    spec = get_conversation_spec(conv)
-    at_least = config.get("read_at_least", 10)
-    proc = await asyncio.create_subprocess_exec(
-        "keybase", "chat", "read", "--at-least", str(at_least), spec,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
-    )
-    stdout, stderr = await proc.communicate()
-    if proc.returncode != 0:
-        return f"Error reading previous messages: {stderr.decode().strip()}"
-    return stdout.decode()
-
-async def send_message_cmd(conversation_id, message):
+async def read_previous_messages(app, channel, config):
+    """Return (entries, error) for the latest messages of a channel.
+
+    entries holds (message id, display line) pairs, oldest first; error is
+    None unless nothing could be read. Edits, reactions and other
+    non-displayable messages count toward each page, so older pages are read
+    until at least read_at_least lines are collected (or HISTORY_MAX_PAGES
+    is reached).
+    """
+    at_least = config["read_at_least"]
+    pagination = {"num": at_least}
+    entries = []
+    for _ in range(HISTORY_MAX_PAGES):
+        payload = {
+            "method": "read",
+            "params": {
+                "options": {
+                    "channel": channel,
+                    "pagination": pagination
+                }
+            }
+        }
+        data = await app.api_call(payload)
+        error = api_error(data)
+        if error:
+            if entries:
+                break
+            return [], f"Error reading previous messages: {error}"
+        result = data.get("result", {})
+        # The API returns the newest message first.
+        page = [m["msg"] for m in result.get("messages") or [] if "msg" in m]
+        for msg in page:
+            line = format_message(msg)
+            if line is not None:
+                entries.append((msg.get("id", 0), line))
+        next_page = result.get("pagination", {})
+        if len(entries) >= at_least or not page or next_page.get("last") or not next_page.get("next"):
+            break
+        pagination = {"num": at_least, "next": next_page["next"]}
+    entries.reverse()
+    return entries, None
+
+async def send_message_cmd(app, conversation_id, message):
+    """Send a text message and return the API error message, or None on success."""
     payload = {
         "method": "send",
         "params": {
@@ -115,53 +200,110 @@ async def send_message_cmd(conversation_id, message):
             }
         }
     }
-    proc = await asyncio.create_subprocess_exec(
-        "keybase", "chat", "api", "-m", json.dumps(payload),
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
-    )
-    await proc.communicate()
+    return api_error(await app.api_call(payload))
 
-async def attach_file_cmd(conv, file_path):
-    if not os.path.exists(file_path):
-        return f"File '{file_path}' does not exist."
-    spec = get_conversation_spec(conv)
-    proc = await asyncio.create_subprocess_exec(
-        "keybase", "chat", "upload", spec, file_path,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
-    )
+async def api_call_oneshot(payload):
+    """Run one request in its own `keybase chat api` process.
+
+    Used for uploads and downloads, which would otherwise hold
+    KeybaseChatApp.api_lock for the whole transfer.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "keybase", "chat", "api", "-m", orjson.dumps(payload).decode(),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except OSError as e:
+        return {"error": {"message": f"Error starting keybase chat api: {e}"}}
     stdout, stderr = await proc.communicate()
-    if proc.returncode != 0:
-        return f"Error attaching file: {stderr.decode().strip()}"
+    try:
+        return orjson.loads(stdout)
+    except orjson.JSONDecodeError:
+        return {"error": {"message": stderr.decode().strip() or "keybase chat api returned no reply"}}
+
+async def attach_file_cmd(channel, file_path):
+    if not await asyncio.to_thread(os.path.exists, file_path):
+        return f"File '{file_path}' does not exist."
+    payload = {
+        "method": "attach",
+        "params": {
+            "options": {
+                "channel": channel,
+                "filename": os.path.abspath(file_path)
+            }
+        }
+    }
+    error = api_error(await api_call_oneshot(payload))
+    if error:
+        return f"Error attaching file: {error}"
     return "File attached successfully."
 
-async def download_file_cmd(conv, file_identifier, config):
-    spec = get_conversation_spec(conv)
-    download_dir = config.get("download_path", ".")
-    if not os.path.exists(download_dir):
-        os.makedirs(download_dir)
-    out_file = os.path.join(download_dir, file_identifier)
-    proc = await asyncio.create_subprocess_exec(
-        "keybase", "chat", "download", spec, file_identifier, "--outfile", out_file,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
-    )
-    stdout, stderr = await proc.communicate()
-    if proc.returncode != 0:
-        return f"Error downloading file: {stderr.decode().strip()}"
+async def download_file_cmd(app, channel, message_id, config):
+    if not message_id.isdigit():
+        return f"'{message_id}' is not a message ID."
+    download_dir = config["download_path"]
+    # Create the download directory on the first /df only, so starting the
+    # client never needs a writable working directory.
+    if not app.download_dir_ready:
+        try:
+            await asyncio.to_thread(os.makedirs, download_dir, exist_ok=True)
+            app.download_dir_ready = True
+        except OSError as e:
+            logger.debug("Error creating download directory %s: %s", download_dir, e)
+    out_file = os.path.abspath(os.path.join(download_dir, message_id))
+    payload = {
+        "method": "download",
+        "params": {
+            "options": {
+                "channel": channel,
+                "message_id": int(message_id),
+                "output": out_file
+            }
+        }
+    }
+    error = api_error(await api_call_oneshot(payload))
+    if error:
+        return f"Error downloading file: {error}"
     return f"File downloaded successfully to {out_file}."
 
+def format_message(msg):
+    """Render an API message object as a single display line, or None if it has no visible content."""
+    content = msg.get("content", {})
+    ctype = content.get("type")
+    if ctype == "text":
+        body = content.get("text", {}).get("body", "")
+    elif ctype == "attachment":
+        body = f"<attachment: {content.get('attachment', {}).get('object', {}).get('filename', '')}>"
+    else:
+        return None
+    sender = msg.get("sender", {}).get("username", "unknown")
+    return f"[{msg.get('id')}] [{sender}] {body}"
+
 def get_help_text():
     return (
         "Commands:\n"
         "  /help                  - Show this help message.\n"
         "  /cc [conversation]     - Change channel. With an argument, switches to that conversation.\n"
         "  /af <file_path>        - Attach a file to the conversation.\n"
-        "  /df <file_identifier>  - Download a file (provide file/message ID).\n"
+        "  /df <message_id>       - Download the attachment of a message.\n"
         "  /quit                  - Quit the application.\n"
     )
 
+#########################################
+# Widgets
+#########################################
+
+class TextItem(ListItem):
+    """A ListItem that renders plain text itself instead of wrapping a Static child."""
+
+    def __init__(self, text, **kwargs):
+        super().__init__(**kwargs)
+        self.text = Text(text)
+
+    def render(self):
+        return self.text
+
 #########################################
 # Conversation Selection Screen
 #########################################
@@ -178,33 +320,75 @@ class ConversationSelectionScreen(Screen):
         self.config = config
         self.current_user = current_user
         self.conversations = []
+        self._by_id = {}
+        # (conv_id, name) pairs currently shown in list_view.
+        self._visible = None
+        self.refresh_task = None
     
     async def on_mount(self) -> None:
-        self.conversations = await list_conversations()
-        if self.config.get("max_recent", 0) > 0:
-            self.conversations = sorted(
-                self.conversations, key=lambda c: c.get("active_at", 0), reverse=True
-            )[:self.config["max_recent"]]
+        self.list_view = ListView()
+        container = Vertical(Header(), self.list_view, Footer())
+        await self.mount(container)
+        conversations, from_cache = await list_conversations_cached(
+            self.app, self.config, self.current_user
+        )
+        await self.show_conversations(conversations)
+        if from_cache:
+            # Show the cached list right away and refresh it in the background.
+            self.refresh_task = asyncio.create_task(self.refresh_conversations(conversations))
+
+    async def on_unmount(self) -> None:
+        if self.refresh_task is not None:
+            self.refresh_task.cancel()
+
+    async def refresh_conversations(self, cached):
+        conversations = await list_conversations(self.app)
+        if not conversations:
+            return
+        await asyncio.to_thread(write_conversation_cache, self.current_user, conversations)
+        if conversations != cached:
+            await self.show_conversations(conversations)
+
+    async def show_conversations(self, conversations):
+        if self.config["max_recent"] > 0:
+            self.conversations = heapq.nlargest(
+                self.config["max_recent"], conversations, key=lambda c: c.get("active_at", 0)
+            )
         else:
             self.conversations = sorted(
-                self.conversations, key=lambda c: c.get("active_at", 0), reverse=True
+                conversations, key=lambda c: c.get("active_at", 0), reverse=True
             )
-        items = []
+        hides_lc = tuple(h.lower() for h in self.config["hide_names"])
+        visible = []
+        self._by_id = {}
         for conv in self.conversations:
             name = conversation_display_name(conv, self.current_user)
-            if any(h.lower() in name.lower() for h in self.config.get("hide_names", [])):
-                continue
-            # Prefix the conversation id with "conv_" for a valid identifier.
-            item = ListItem(Static(name, markup=False), id="conv_" + str(conv.get("id")))
-            items.append(item)
-        self.list_view = ListView(*items)
-        container = Vertical(Header(), self.list_view, Footer())
-        await self.mount(container)
+            if hides_lc:
+                name_lc = name.lower()
+                if any(h in name_lc for h in hides_lc):
+                    continue
+            conv_id = str(conv.get("id"))
+            self._by_id[conv_id] = conv
+            visible.append((conv_id, name))
+        if visible == self._visible:
+            # Only fields such as active_at changed; keep the list as it is.
+            return
+        self._visible = visible
+
+        # Keep the highlight on the same conversation across a rebuild.
+        highlighted = self.list_view.highlighted_child
+        highlighted_id = highlighted.id if highlighted is not None else None
+        # Prefix the conversation id with "conv_" for a valid identifier.
+        items = [TextItem(name, id="conv_" + conv_id) for conv_id, name in visible]
+        await self.list_view.clear()
+        await self.list_view.extend(items)
+        if items:
+            ids = [item.id for item in items]
+            self.list_view.index = ids.index(highlighted_id) if highlighted_id in ids else 0
     
     async def on_list_view_selected(self, message: ListView.Selected) -> None:
-        conv_id_with_prefix = message.item.id
-        conv_id = conv_id_with_prefix.replace("conv_", "")
-        conv = next((c for c in self.conversations if str(c.get("id")) == conv_id), None)
+        # Strip the "conv_" prefix added in show_conversations.
+        conv = self._by_id.get(message.item.id[5:])
         if conv:
             await self.app.push_screen(ChatScreen(conv, self.config, self.current_user))
 
@@ -221,10 +405,16 @@ class ChatScreen(Screen):
         self.conversation = conversation
         self.config = config
         self.current_user = current_user
-        self.listen_task = None
-        self.running = True
-        self.seen_ids = set()
-        self.last_poll_timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        self.channel = conversation.get("channel", {})
+        self.conv_id = str(conversation.get("id"))
+        # Message ids increase within a conversation, so the highest id shown
+        # so far is enough to recognise duplicates.
+        self.max_msg_id = 0
+        # (id, line) pairs received but not yet mounted; flushed together by
+        # a short timer once history is on screen.
+        self._pending = []
+        self._flush_timer = None
+        self._history_loaded = False
 
     async def on_mount(self) -> None:
         self.header = Header()
@@ -237,64 +427,56 @@ class ChatScreen(Screen):
         # Set focus to the input box (no await needed)
         self.set_focus(self.input_box)
 
-        # Load previous messages and add as ListItems.
-        prev = await read_previous_messages(self.conversation, self.config)
-        for line in prev.splitlines():
-            m = re.match(r"\[(\d+)\]", line)
-            if m:
-                self.seen_ids.add(m.group(1))
-            await self.message_list.append(ListItem(Static(line, markup=False)))
-
-        # Start background polling for new messages using --since option.
-        self.listen_task = asyncio.create_task(self.listen_messages())
-
-
-    async def poll_iteration(self):
-        proc = await asyncio.create_subprocess_exec(
-            "keybase", "chat", "read", "--since", self.last_poll_timestamp, get_conversation_spec(self.conversation),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await proc.communicate()
-        new_timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        logging.debug(f"Polling: Old timestamp: {self.last_poll_timestamp} -> New timestamp: {new_timestamp}")
-        self.last_poll_timestamp = new_timestamp
-        if proc.returncode != 0:
-            logging.debug(f"Poll returned error: {stderr.decode().strip()}")
+        # New messages are pushed to us by the app-wide api-listen reader.
+        # Register before reading history so nothing sent meanwhile is lost;
+        # add_message holds those messages back until history is mounted.
+        self.app.chat_screens[self.conv_id] = self
+
+        # Load previous messages and mount them as ListItems in one batch.
+        entries, error = await read_previous_messages(self.app, self.channel, self.config)
+        if error:
+            await self.message_list.append(TextItem(error))
+        await self.message_list.extend([TextItem(line) for _, line in entries])
+        history_max_id = max((msg_id for msg_id, _ in entries), default=0)
+
+        # Drop pushed messages that the history already showed, then flush the rest.
+        self._pending = [(msg_id, line) for msg_id, line in self._pending if msg_id > history_max_id]
+        self.max_msg_id = max(self.max_msg_id, history_max_id)
+        self._history_loaded = True
+        if self._pending:
+            await self.flush_pending()
+
+    async def on_unmount(self) -> None:
+        self.app.chat_screens.pop(self.conv_id, None)
+
+    def add_message(self, msg):
+        """Queue a message delivered by api-listen unless it is already displayed."""
+        line = format_message(msg)
+        if line is not None:
+            self.add_line(msg.get("id", 0), line)
+
+    def add_line(self, msg_id, line):
+        if msg_id <= self.max_msg_id:
             return
-        new_lines = stdout.decode().splitlines()
-        logging.debug(f"Poll returned {len(new_lines)} lines.")
-        for line in new_lines:
-            m = re.match(r"\[(\d+)\]", line)
-            if m:
-                msg_id = m.group(1)
-                if msg_id not in self.seen_ids:
-                    self.seen_ids.add(msg_id)
-                    await self.message_list.append(ListItem(Static(line, markup=False)))
-                    logging.debug(f"New message appended: {line}")
-        self.message_list.scroll_end()  # Removed 'await' here.
-        logging.debug("Poll iteration complete.")
-
-    async def listen_messages(self):
-        while self.running:
-            await asyncio.sleep(5)
-            try:
-                await self.poll_iteration()
-            except Exception as e:
-                logging.debug(f"Exception in listen_messages: {e}")
+        self.max_msg_id = msg_id
+        self._pending.append((msg_id, line))
+        if self._history_loaded and self._flush_timer is None:
+            self._flush_timer = self.set_timer(MESSAGE_FLUSH_DELAY, self.flush_pending)
+        logger.debug("New message queued: %s", line)
+
+    async def flush_pending(self):
+        """Mount every queued message at once and scroll to the bottom."""
+        self._flush_timer = None
+        pending, self._pending = self._pending, []
+        await self.message_list.extend([TextItem(line) for _, line in pending])
+        self.message_list.scroll_end()
 
     async def action_pop_chat(self) -> None:
         """Return to the conversation selection screen."""
-        self.running = False
-        if self.listen_task:
-            self.listen_task.cancel()
         await self.app.pop_screen()
 
     async def action_quit_app(self) -> None:
         """Exit the entire application."""
-        self.running = False
-        if self.listen_task:
-            self.listen_task.cancel()
         self.app.exit()
 
     async def on_input_submitted(self, message: Input.Submitted) -> None:
@@ -305,13 +487,13 @@ class ChatScreen(Screen):
             cmd = parts[0].lower()
             arg = parts[1] if len(parts) > 1 else ""
             if cmd == "/help":
-                await self.message_list.append(ListItem(Static(get_help_text(), markup=False)))
+                await self.message_list.append(TextItem(get_help_text()))
             elif cmd == "/quit":
                 await self.action_quit_app()
                 return
             elif cmd == "/cc":
                 if arg:
-                    await self.message_list.append(ListItem(Static(f"Switching to conversation: {arg}", markup=False)))
+                    await self.message_list.append(TextItem(f"Switching to conversation: {arg}"))
                     await self.app.pop_screen()
                     return
                 else:
@@ -319,22 +501,23 @@ class ChatScreen(Screen):
                     return
             elif cmd == "/af":
                 if arg:
-                    result = await attach_file_cmd(self.conversation, arg)
-                    await self.message_list.append(ListItem(Static(result, markup=False)))
+                    result = await attach_file_cmd(self.channel, arg)
+                    await self.message_list.append(TextItem(result))
                 else:
-                    await self.message_list.append(ListItem(Static("Usage: /af <file_path>", markup=False)))
+                    await self.message_list.append(TextItem("Usage: /af <file_path>"))
             elif cmd == "/df":
                 if arg:
-                    result = await download_file_cmd(self.conversation, arg, self.config)
-                    await self.message_list.append(ListItem(Static(result, markup=False)))
+                    result = await download_file_cmd(self.app, self.channel, arg, self.config)
+                    await self.message_list.append(TextItem(result))
                 else:
-                    await self.message_list.append(ListItem(Static("Usage: /df <file_identifier>", markup=False)))
+                    await self.message_list.append(TextItem("Usage: /df <message_id>"))
             else:
-                await self.message_list.append(ListItem(Static("Unknown command. Type /help for help.", markup=False)))
+                await self.message_list.append(TextItem("Unknown command. Type /help for help."))
         else:
-            await send_message_cmd(self.conversation.get("id"), user_input)
-            # Immediately poll for new messages after sending a message.
-            await self.poll_iteration()
+            # The sent message comes back through api-listen (--local).
+            error = await send_message_cmd(self.app, self.conv_id, user_input)
+            if error:
+                await self.message_list.append(TextItem(f"Error sending message: {error}"))
 
     
 #########################################
@@ -344,14 +527,137 @@ class ChatScreen(Screen):
 class KeybaseChatApp(App):
     async def on_load(self) -> None:
         self.config = load_config()
+        self.download_dir_ready = False
+        self.api_proc = await self.start_api_proc()
+        # Responses are not tagged with a request id, so only one request
+        # may be in flight at a time.
+        self.api_lock = asyncio.Lock()
         self.current_user = await get_current_user()
         if not self.current_user:
             print("Unable to determine current user. Exiting.")
             await self.shutdown()
     
     async def on_mount(self) -> None:
+        # One api-listen subscription streams notifications for every
+        # conversation; open ChatScreens register here by conversation id.
+        self.chat_screens = {}
+        self.listen_warned = False
+        self.listen_proc = await self.start_listen_proc()
+        self.listen_task = asyncio.create_task(self.listen_messages())
         await self.push_screen(ConversationSelectionScreen(self.config, self.current_user))
 
+    async def start_listen_proc(self):
+        return await asyncio.create_subprocess_exec(
+            "keybase", "chat", "api-listen", "--local",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=API_LINE_LIMIT
+        )
+
+    async def restart_listen_proc(self):
+        """Wait for the exited api-listen process and keep trying to start a new one."""
+        returncode = await self.listen_proc.wait()
+        logger.debug("api-listen exited with %s; restarting", returncode)
+        # Warn once per outage, not on every failed restart.
+        if not self.listen_warned:
+            self.listen_warned = True
+            self.notify("Lost the keybase message stream; reconnecting.", severity="warning")
+        while True:
+            await asyncio.sleep(LISTEN_RESTART_DELAY)
+            try:
+                self.listen_proc = await self.start_listen_proc()
+                break
+            except OSError as e:
+                logger.debug("Error restarting api-listen: %s", e)
+        await self.catch_up_chats()
+
+    async def catch_up_chats(self):
+        """Re-read the latest messages of every open chat to fill the gap left by a restart."""
+        for screen in list(self.chat_screens.values()):
+            entries, error = await read_previous_messages(self, screen.channel, self.config)
+            if error:
+                logger.debug("Catch-up read for %s failed: %s", screen.conv_id, error)
+            # add_line skips anything at or below the screen's max_msg_id.
+            for msg_id, line in entries:
+                screen.add_line(msg_id, line)
+
+    async def listen_messages(self):
+        while True:
+            try:
+                line = await self.listen_proc.stdout.readline()
+                if not line:
+                    await self.restart_listen_proc()
+                    continue
+                self.listen_warned = False
+                notification = orjson.loads(line)
+                msg = notification.get("msg")
+                if notification.get("type") != "chat" or not msg:
+                    continue
+                screen = self.chat_screens.get(msg.get("conversation_id"))
+                if screen is not None:
+                    screen.add_message(msg)
+            except Exception as e:
+                logger.debug("Exception in listen_messages: %s", e)
+
+    async def on_unmount(self) -> None:
+        self.listen_task.cancel()
+        if self.listen_proc.returncode is None:
+            self.listen_proc.terminate()
+            await self.listen_proc.wait()
+        if self.api_proc.returncode is None:
+            self.api_proc.stdin.close()
+            await self.api_proc.wait()
+
+    async def start_api_proc(self):
+        # A single long-lived `keybase chat api` process services every
+        # JSON-RPC request; it reads one JSON object per line on stdin and
+        # answers with one JSON line on stdout.
+        return await asyncio.create_subprocess_exec(
+            "keybase", "chat", "api",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=API_LINE_LIMIT
+        )
+
+    async def stop_api_proc(self):
+        if self.api_proc.returncode is None:
+            self.api_proc.kill()
+        # Drain what is left of stdout so the pipe reaches EOF, then reap the
+        # process so returncode is set and the next call respawns it.
+        while await self.api_proc.stdout.read(API_LINE_LIMIT):
+            pass
+        await self.api_proc.wait()
+
+    async def api_call(self, payload):
+        """Send one request over the persistent `keybase chat api` pipe and return the decoded reply."""
+        async with self.api_lock:
+            if self.api_proc.returncode is not None:
+                # The previous process died (e.g. the keybase service
+                # restarted); start a new one rather than failing forever.
+                try:
+                    self.api_proc = await self.start_api_proc()
+                except OSError as e:
+                    return {"error": {"message": f"Error starting keybase chat api: {e}"}}
+            try:
+                self.api_proc.stdin.write(orjson.dumps(payload) + b"\n")
+                await self.api_proc.stdin.drain()
+                line = await self.api_proc.stdout.readline()
+            except (BrokenPipeError, ConnectionResetError):
+                line = b""
+            except ValueError as e:
+                # An oversized reply leaves the pipe out of step with our
+                # requests, so stop trusting this process.
+                await self.stop_api_proc()
+                return {"error": {"message": f"Error reading API response: {e}"}}
+            if not line:
+                await self.stop_api_proc()
+                return {"error": {"message": "keybase chat api exited unexpectedly"}}
+        try:
+            return orjson.loads(line)
+        except Exception as e:
+            return {"error": {"message": f"Error parsing API response: {e}"}}
+
 if __name__ == "__main__":
     KeybaseChatApp().run()
 